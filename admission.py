@@ -0,0 +1,187 @@
+from flask import request, jsonify, g
+from collections import OrderedDict
+from werkzeug.middleware.proxy_fix import ProxyFix
+import math
+import os
+import threading
+import time
+from src.routes.metrics import ADMISSION_REJECTIONS
+
+ADMISSION_ENABLED = os.environ.get('ADMISSION_ENABLED', '1') == '1'
+
+# Route class -> (max concurrent requests, max queued requests, max queue wait in ms)
+ROUTE_CLASS_DEFAULTS = {
+    'read': (32, 64, 1000),
+    'search': (8, 32, 2000),
+    'mutation': (4, 16, 2000),
+    'login': (4, 8, 1000),
+}
+
+# Per-client token bucket on login/register: sustained requests per minute and burst size.
+# Clients are keyed by request.remote_addr. Behind a reverse proxy that is the proxy's address,
+# so every client would share one bucket: set TRUSTED_PROXY_HOPS to the number of proxies in
+# front of the app to take the client address from X-Forwarded-For (via werkzeug's ProxyFix).
+# Only set it when those proxies overwrite X-Forwarded-For, otherwise clients can spoof it.
+TRUSTED_PROXY_HOPS = int(os.environ.get('TRUSTED_PROXY_HOPS', 0))
+AUTH_RATE_PER_MIN = float(os.environ.get('AUTH_RATE_PER_MIN', 10))
+AUTH_BURST = int(os.environ.get('AUTH_BURST', 5))
+# Upper bound on tracked clients so the bucket table cannot grow without limit
+AUTH_MAX_CLIENTS = int(os.environ.get('AUTH_MAX_CLIENTS', 10000))
+
+RATE_LIMITED_ROUTES = {'/api/auth/login', '/api/auth/register'}
+SEARCH_ROUTES = {'/api/properties', '/api/users'}
+EXEMPT_ROUTES = {'/health', '/metrics'}
+
+
+def _class_config(name):
+    concurrency, queue, timeout_ms = ROUTE_CLASS_DEFAULTS[name]
+    prefix = f'ADMISSION_{name.upper()}'
+    return (
+        int(os.environ.get(f'{prefix}_CONCURRENCY', concurrency)),
+        int(os.environ.get(f'{prefix}_QUEUE', queue)),
+        float(os.environ.get(f'{prefix}_TIMEOUT_MS', timeout_ms)) / 1000
+    )
+
+
+class AdmissionGate:
+    def __init__(self, name, max_concurrent, max_queue, timeout):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.active = 0
+        self.waiting = 0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            if self.active < self.max_concurrent and not self.waiting:
+                self.active += 1
+                return True
+
+            # Shed immediately instead of queueing behind a full backlog
+            if self.waiting >= self.max_queue:
+                return False
+
+            deadline = time.monotonic() + self.timeout
+            self.waiting += 1
+            try:
+                while self.active >= self.max_concurrent:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+                self.active += 1
+                return True
+            finally:
+                self.waiting -= 1
+
+    def release(self):
+        with self._cond:
+            self.active -= 1
+            self._cond.notify()
+
+    def retry_after(self):
+        # Ask clients to back off for at least one queue deadline
+        return max(1, math.ceil(self.timeout))
+
+
+class TokenBucketLimiter:
+    def __init__(self, rate_per_sec, burst, max_clients):
+        self.rate = rate_per_sec
+        self.burst = burst
+        self.max_clients = max_clients
+        # Ordered by last use, so the least recently seen client is evicted first
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def consume(self, key):
+        # Returns 0 when allowed, otherwise seconds until a token is available
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(key, (self.burst, now))
+            tokens = min(self.burst, tokens + (now - updated) * self.rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+
+            return 0 if allowed else (1 - tokens) / self.rate
+
+
+gates = {name: AdmissionGate(name, *_class_config(name)) for name in ROUTE_CLASS_DEFAULTS}
+auth_limiter = TokenBucketLimiter(AUTH_RATE_PER_MIN / 60, AUTH_BURST, AUTH_MAX_CLIENTS)
+
+
+def classify_request():
+    rule = request.url_rule.rule if request.url_rule is not None else None
+
+    if rule in EXEMPT_ROUTES or request.method == 'OPTIONS':
+        return None
+    if rule in RATE_LIMITED_ROUTES:
+        return 'login'
+    if request.method in ('POST', 'PUT', 'PATCH', 'DELETE'):
+        return 'mutation'
+    if rule in SEARCH_ROUTES:
+        return 'search'
+    return 'read'
+
+
+def _busy_response(retry_after, message, code, status):
+    response = jsonify({
+        'success': False,
+        'message': message,
+        'code': code,
+        'retryAfter': retry_after
+    })
+    response.status_code = status
+    response.headers['Retry-After'] = str(retry_after)
+    return response
+
+
+def _before_request():
+    route_class = classify_request()
+    if route_class is None:
+        return None
+
+    if route_class == 'login':
+        wait = auth_limiter.consume((request.url_rule.rule, request.remote_addr))
+        if wait:
+            ADMISSION_REJECTIONS.inc(route_class, 'rate_limited')
+            return _busy_response(
+                max(1, math.ceil(wait)),
+                'Muitas tentativas. Tente novamente mais tarde',
+                'RATE_LIMITED',
+                429
+            )
+
+    gate = gates[route_class]
+    if not gate.acquire():
+        ADMISSION_REJECTIONS.inc(route_class, 'overloaded')
+        return _busy_response(
+            gate.retry_after(),
+            'Servidor sobrecarregado. Tente novamente em instantes',
+            'SERVER_BUSY',
+            503
+        )
+    g._admission_gate = gate
+    return None
+
+
+def _teardown_request(exc):
+    gate = g.pop('_admission_gate', None)
+    if gate is not None:
+        gate.release()
+
+
+def init_admission(app):
+    if TRUSTED_PROXY_HOPS:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=TRUSTED_PROXY_HOPS)
+    if not ADMISSION_ENABLED:
+        return
+    app.before_request(_before_request)
+    app.teardown_request(_teardown_request)
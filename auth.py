@@ -3,6 +3,8 @@ from datetime import datetime, timedelta
 import jwt
 import hashlib
 import os
+from src.routes.metrics import TOKEN_DECODES
+from src.routes.profiling import phase
 
 auth_bp = Blueprint('auth', __name__)
 
@@ -43,6 +45,20 @@ def generate_token(user_data):
     }
     return jwt.encode(payload, SECRET_KEY, algorithm='HS256')
 
+def decode_token(token, source):
+    # Shared JWT decode so every caller is counted in tl_token_decodes_total
+    try:
+        with phase('auth'):
+            payload = jwt.decode(token, SECRET_KEY, algorithms=['HS256'])
+    except jwt.ExpiredSignatureError:
+        TOKEN_DECODES.inc(source, 'expired')
+        raise
+    except jwt.InvalidTokenError:
+        TOKEN_DECODES.inc(source, 'invalid')
+        raise
+    TOKEN_DECODES.inc(source, 'ok')
+    return payload
+
 @auth_bp.route('/auth/login', methods=['POST'])
 def login():
     try:
@@ -180,7 +196,7 @@ def get_profile():
         token = auth_header.split(' ')[1]
         
         try:
-            payload = jwt.decode(token, SECRET_KEY, algorithms=['HS256'])
+            payload = decode_token(token, 'auth')
             user_email = payload.get('email')
             
             if user_email in users_db:
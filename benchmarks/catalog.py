@@ -0,0 +1,144 @@
+import hashlib
+import random
+from datetime import datetime, timedelta
+
+# (city, state, CEP prefix range, rent multiplier, neighbourhoods)
+CITIES = [
+    ('São Paulo', 'SP', (1000, 5999), 1.35, ['Centro', 'Jardins', 'Vila Madalena', 'Pinheiros', 'Moema', 'Itaim Bibi', 'Tatuapé', 'Santana']),
+    ('Rio de Janeiro', 'RJ', (20000, 23799), 1.30, ['Copacabana', 'Ipanema', 'Leblon', 'Botafogo', 'Tijuca', 'Barra da Tijuca', 'Flamengo']),
+    ('Belo Horizonte', 'MG', (30000, 31999), 1.00, ['Savassi', 'Lourdes', 'Funcionários', 'Pampulha', 'Buritis']),
+    ('Curitiba', 'PR', (80000, 82999), 0.95, ['Batel', 'Água Verde', 'Centro Cívico', 'Bigorrilho', 'Portão']),
+    ('Porto Alegre', 'RS', (90000, 91999), 0.95, ['Moinhos de Vento', 'Bela Vista', 'Menino Deus', 'Petrópolis', 'Cidade Baixa']),
+    ('Brasília', 'DF', (70000, 72799), 1.20, ['Asa Sul', 'Asa Norte', 'Lago Sul', 'Sudoeste', 'Águas Claras']),
+    ('Salvador', 'BA', (40000, 42599), 0.85, ['Barra', 'Pituba', 'Rio Vermelho', 'Graça', 'Itaigara']),
+    ('Recife', 'PE', (50000, 52999), 0.85, ['Boa Viagem', 'Casa Forte', 'Espinheiro', 'Graças', 'Pina']),
+    ('Fortaleza', 'CE', (60000, 61599), 0.80, ['Meireles', 'Aldeota', 'Cocó', 'Praia de Iracema', 'Fátima']),
+    ('Florianópolis', 'SC', (88000, 88099), 1.10, ['Centro', 'Trindade', 'Lagoa da Conceição', 'Jurerê', 'Itacorubi']),
+    ('Campinas', 'SP', (13000, 13139), 0.95, ['Cambuí', 'Taquaral', 'Barão Geraldo', 'Guanabara']),
+    ('Goiânia', 'GO', (74000, 74899), 0.80, ['Setor Bueno', 'Setor Marista', 'Setor Oeste', 'Jardim Goiás']),
+]
+# Population-ish weights so the big capitals dominate the catalog
+CITY_WEIGHTS = [30, 18, 8, 6, 6, 7, 5, 5, 5, 4, 3, 3]
+
+STREETS = [
+    'Rua das Flores', 'Rua dos Pinheiros', 'Rua Harmonia', 'Avenida Paulista', 'Rua Augusta',
+    'Avenida Brasil', 'Rua XV de Novembro', 'Rua Sete de Setembro', 'Avenida Atlântica',
+    'Rua da Consolação', 'Avenida Getúlio Vargas', 'Rua Barão do Rio Branco', 'Rua Tiradentes',
+    'Avenida Beira Mar', 'Rua Santos Dumont', 'Rua Marechal Deodoro', 'Rua Dom Pedro II'
+]
+
+# (type, title noun, bedroom range, area range m², base rent, weight)
+TYPES = [
+    ('APARTMENT', 'Apartamento', (1, 4), (35, 160), 2400, 55),
+    ('HOUSE', 'Casa', (2, 5), (80, 350), 3800, 20),
+    ('STUDIO', 'Studio', (0, 0), (20, 45), 1600, 12),
+    ('COMMERCIAL', 'Sala comercial', (0, 0), (25, 300), 3500, 8),
+    ('LAND', 'Terreno', (0, 0), (200, 2000), 1200, 5),
+]
+TYPE_WEIGHTS = [t[5] for t in TYPES]
+
+STATUSES = ['AVAILABLE', 'RENTED', 'MAINTENANCE']
+STATUS_WEIGHTS = [45, 48, 7]
+
+AMENITIES = [
+    'Piscina', 'Academia', 'Portaria 24h', 'Elevador', 'Quintal', 'Área Gourmet',
+    'Garagem Coberta', 'Internet', 'Mobiliado', 'Churrasqueira', 'Salão de Festas',
+    'Playground', 'Varanda', 'Ar-condicionado', 'Lavanderia'
+]
+
+DESCRIPTIONS = [
+    'Imóvel bem localizado, próximo a comércio e transporte público',
+    'Excelente iluminação natural e ventilação cruzada',
+    'Reformado recentemente, pronto para morar',
+    'Condomínio com segurança e lazer completo',
+    'Vista panorâmica e acabamento de alto padrão',
+    'Rua tranquila, ideal para famílias',
+]
+
+# Shared lists: at 1M records per-record copies would dominate memory
+IMAGE_SETS = [
+    [f'https://images.unsplash.com/photo-{1500000000000 + i * 7919}-{hashlib.md5(str(i).encode()).hexdigest()[:12]}?w=800'
+     for i in range(start, start + size)]
+    for start, size in ((0, 1), (10, 2), (20, 3), (30, 2), (40, 4), (50, 1), (60, 3))
+]
+
+BASE_DATE = datetime(2025, 1, 1)
+
+
+def _amenity_sets(rng, count=64):
+    return [sorted(rng.sample(AMENITIES, rng.randint(1, 5))) for _ in range(count)]
+
+
+def generate_catalog(size, seed=42, owner_ids=('1',)):
+    rng = random.Random(seed)
+    amenity_sets = _amenity_sets(rng)
+    catalog = []
+
+    for index in range(size):
+        city, state, cep_range, multiplier, neighbourhoods = rng.choices(CITIES, CITY_WEIGHTS)[0]
+        type_code, noun, bedrooms_range, area_range, base_rent, _ = rng.choices(TYPES, TYPE_WEIGHTS)[0]
+        neighbourhood = rng.choice(neighbourhoods)
+        bedrooms = rng.randint(*bedrooms_range)
+        area = round(rng.uniform(*area_range), 1)
+        status = rng.choices(STATUSES, STATUS_WEIGHTS)[0]
+        rent = round(base_rent * multiplier * (0.6 + area / area_range[1]) * rng.uniform(0.8, 1.25), -1)
+        created = BASE_DATE - timedelta(days=rng.randint(0, 720))
+        updated = created + timedelta(days=rng.randint(0, 60))
+
+        if bedrooms:
+            title = f'{noun} {bedrooms} quarto{"s" if bedrooms > 1 else ""} - {neighbourhood}'
+        else:
+            title = f'{noun} - {neighbourhood}'
+
+        listing = {
+            'id': str(index + 1),
+            'title': title,
+            'description': rng.choice(DESCRIPTIONS),
+            'type': type_code,
+            'status': status,
+            'address': f'{rng.choice(STREETS)}, {rng.randint(1, 3999)}',
+            'city': city,
+            'state': state,
+            'zipCode': f'{rng.randint(*cep_range):05d}-{rng.randint(0, 999):03d}',
+            'monthlyRent': float(max(rent, 500)),
+            'bedrooms': bedrooms,
+            'bathrooms': max(1, bedrooms - rng.randint(0, 1)),
+            'area': area,
+            'parking': rng.randint(0, min(bedrooms, 3)),
+            'furnished': rng.random() < 0.3,
+            'petAllowed': rng.random() < 0.4,
+            'images': rng.choice(IMAGE_SETS),
+            'amenities': rng.choice(amenity_sets),
+            'ownerId': rng.choice(owner_ids),
+            'createdAt': created.isoformat() + 'Z',
+            'updatedAt': updated.isoformat() + 'Z'
+        }
+        if status == 'RENTED':
+            listing['tenantId'] = '2'
+        catalog.append(listing)
+
+    return catalog
+
+
+def generate_users(size, seed=42):
+    rng = random.Random(seed + 1)
+    first_names = ['Ana', 'Bruno', 'Carla', 'Diego', 'Fernanda', 'Gabriel', 'Juliana', 'Lucas', 'Mariana', 'Rafael']
+    last_names = ['Silva', 'Santos', 'Oliveira', 'Souza', 'Lima', 'Pereira', 'Costa', 'Almeida', 'Ferreira']
+    password = hashlib.sha256('123456'.encode()).hexdigest()
+    users = {}
+
+    for index in range(size):
+        email = f'bench{index}@tlbuilding.com'
+        users[email] = {
+            'id': str(1000 + index),
+            'email': email,
+            'password': password,
+            'firstName': rng.choice(first_names),
+            'lastName': rng.choice(last_names),
+            'role': rng.choice(['OWNER', 'TENANT', 'TENANT']),
+            'isActive': True,
+            'emailVerified': True,
+            'createdAt': '2025-01-01T00:00:00Z'
+        }
+
+    return users
@@ -0,0 +1,395 @@
+# Benchmark runner for the Flask API.
+#
+#   python benchmarks/run.py --size 100000 --workload mixed_filters --workload deep_pagination
+#   python benchmarks/run.py --target http --concurrency 8 --size 10000
+#   python benchmarks/run.py --target http --url http://localhost:5000 --workload detail_reads
+#   python benchmarks/run.py --size 10000 --baseline benchmarks/results/previous.json
+#
+# Servers given with --url run their own admission control; 429/503 responses are reported as
+# 'rejected' and left out of the latency figures.
+#
+# Results are written as JSON (benchmarks/results/ by default) so runs can be diffed over time.
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import http.client
+import json
+import math
+import platform
+import random
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import urlencode, urlsplit
+
+from catalog import generate_catalog, generate_users
+from workloads import WORKLOADS
+
+# Admission control responses (rate limited / shed); counted apart from latency samples
+REJECTED_STATUSES = (429, 503)
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+OWNER_EMAIL = 'admin@tlbuilding.com'
+DEFAULT_USERS = [OWNER_EMAIL, 'user@tlbuilding.com']
+# Run parameters that must match for a --baseline comparison to be meaningful
+COMPARABLE_META = ('target', 'catalogSize', 'concurrency', 'operations', 'seed')
+
+
+class Recorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = {}
+        self.counts = {}
+
+    def record(self, name, elapsed, status):
+        with self._lock:
+            samples = self.samples.setdefault(name, [])
+            counts = self.counts.setdefault(name, {'errors': 0, 'non2xx': 0, 'rejected': 0})
+            # Rejections return in microseconds; timing them would look like a speed-up
+            if status in REJECTED_STATUSES:
+                counts['rejected'] += 1
+                return
+            samples.append(elapsed)
+            # Any non-2xx (including transport failures, status 0) is reported so that
+            # a change that starts failing fast cannot pass as a speed-up
+            if not 200 <= status < 300:
+                counts['non2xx'] += 1
+            if status >= 500 or status == 0:
+                counts['errors'] += 1
+
+
+class _Client:
+    def __init__(self, recorder):
+        self.recorder = recorder
+
+    def get(self, name, path, **kwargs):
+        return self.request(name, 'GET', path, **kwargs)
+
+    def post(self, name, path, **kwargs):
+        return self.request(name, 'POST', path, **kwargs)
+
+    def put(self, name, path, **kwargs):
+        return self.request(name, 'PUT', path, **kwargs)
+
+    def delete(self, name, path, **kwargs):
+        return self.request(name, 'DELETE', path, **kwargs)
+
+    def request(self, name, method, path, params=None, headers=None, json=None):
+        start = time.perf_counter()
+        try:
+            status, body = self._send(method, path, params, headers or {}, json)
+        except (OSError, http.client.HTTPException):
+            status, body = 0, None
+        if self.recorder is not None:
+            self.recorder.record(name, time.perf_counter() - start, status)
+        return status, body
+
+
+class InProcessClient(_Client):
+    def __init__(self, app, recorder=None):
+        super().__init__(recorder)
+        self.client = app.test_client()
+
+    def _send(self, method, path, params, headers, body):
+        response = self.client.open(path, method=method, query_string=params, headers=headers, json=body)
+        return response.status_code, response.get_json(silent=True)
+
+
+class HttpClient(_Client):
+    def __init__(self, base_url, recorder=None):
+        super().__init__(recorder)
+        parts = urlsplit(base_url)
+        if parts.scheme not in ('http', 'https'):
+            raise ValueError(f'Unsupported URL scheme: {parts.scheme!r}')
+        self.connection_class = http.client.HTTPSConnection if parts.scheme == 'https' else http.client.HTTPConnection
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == 'https' else 80)
+        self._local = threading.local()
+
+    def _connection(self):
+        # One keep-alive connection per worker thread
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._local.conn = self.connection_class(self.host, self.port, timeout=30)
+        return conn
+
+    def _send(self, method, path, params, headers, body):
+        if params:
+            path = f'{path}?{urlencode(params)}'
+        payload = None
+        if body is not None:
+            payload = json.dumps(body).encode()
+            headers = {**headers, 'Content-Type': 'application/json'}
+        conn = self._connection()
+        try:
+            conn.request(method, path, body=payload, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            self._local.conn = None
+            raise
+        try:
+            return response.status, json.loads(data) if data else None
+        except ValueError:
+            return response.status, None
+
+
+def _percentile(sorted_values, pct):
+    # Nearest-rank percentile
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _summarize(samples, counts, duration):
+    values = sorted(samples)
+    count = len(values)
+    return {
+        'requests': count,
+        **counts,
+        'throughputRps': round(count / duration, 2) if duration else None,
+        'latencyMs': {
+            'p50': _ms(_percentile(values, 50)),
+            'p95': _ms(_percentile(values, 95)),
+            'p99': _ms(_percentile(values, 99)),
+            'mean': _ms(sum(values) / count) if count else None,
+            'max': _ms(values[-1]) if count else None
+        }
+    }
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 3) if seconds is not None else None
+
+
+def seed_app(size, users, seed):
+    # Measure raw service time by default; export ADMISSION_ENABLED=1 to benchmark load shedding
+    os.environ.setdefault('ADMISSION_ENABLED', '0')
+    from src.main import app
+    from src.routes.properties import properties_db
+    from src.routes.auth import users_db, generate_token
+
+    properties_db[:] = generate_catalog(size, seed=seed)
+    users_db.update(generate_users(users, seed=seed))
+
+    owner = users_db[OWNER_EMAIL]
+    return app, {
+        'catalog_size': size,
+        'user_emails': list(users_db),
+        'owner_token': generate_token(owner)
+    }
+
+
+def start_local_server(app):
+    from werkzeug.serving import make_server, WSGIRequestHandler
+
+    class QuietRequestHandler(WSGIRequestHandler):
+        # Per-request access logs would flood the report and add to measured latency
+        def log_request(self, code='-', size='-'):
+            pass
+
+    server = make_server('127.0.0.1', 0, app, threaded=True, request_handler=QuietRequestHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f'http://127.0.0.1:{server.server_port}'
+
+
+def remote_context(client, size):
+    status, body = client.post('setup_login', '/api/auth/login', json={'email': OWNER_EMAIL, 'password': '123456'})
+    if status != 200:
+        raise SystemExit(f'Could not log in to target server (status {status})')
+    if size is None:
+        _, listing = client.get('setup_count', '/api/properties', params={'limit': 1})
+        size = listing['data']['pagination']['total']
+    return {
+        'catalog_size': max(size, 1),
+        'user_emails': DEFAULT_USERS,
+        'owner_token': body['data']['accessToken']
+    }
+
+
+def run_workload(name, make_client, ctx, operations, warmup, concurrency, seed):
+    step = WORKLOADS[name]
+
+    warm_rng = random.Random(seed - 1)
+    warm_client = make_client(None)
+    for _ in range(warmup):
+        step(warm_client, warm_rng, ctx)
+
+    recorder = Recorder()
+    shares = [operations // concurrency + (1 if i < operations % concurrency else 0) for i in range(concurrency)]
+
+    def worker(index):
+        rng = random.Random(seed * 1000 + index)
+        client = make_client(recorder)
+        for _ in range(shares[index]):
+            step(client, rng, ctx)
+
+    start = time.perf_counter()
+    if concurrency == 1:
+        worker(0)
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(worker, range(concurrency)))
+    duration = time.perf_counter() - start
+
+    all_samples = [v for values in recorder.samples.values() for v in values]
+    totals = {'errors': 0, 'non2xx': 0, 'rejected': 0}
+    for counts in recorder.counts.values():
+        for key, value in counts.items():
+            totals[key] = totals.get(key, 0) + value
+    result = _summarize(all_samples, totals, duration)
+    result['operations'] = operations
+    result['durationSec'] = round(duration, 3)
+    result['byRequest'] = {
+        request_name: _summarize(values, recorder.counts[request_name], duration)
+        for request_name, values in sorted(recorder.samples.items())
+    }
+    return result
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path, force=False):
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    mismatched = [
+        f"{key} {baseline['meta'].get(key)!r} -> {results['meta'].get(key)!r}"
+        for key in COMPARABLE_META
+        if baseline['meta'].get(key) != results['meta'].get(key)
+    ]
+    if mismatched:
+        print(f"\nwarning: {baseline_path} was run with different parameters: {', '.join(mismatched)}",
+              file=sys.stderr)
+        if not force:
+            print('Skipping comparison; pass --force-compare to compare anyway', file=sys.stderr)
+            return
+
+    print(f"\nCompared with {baseline_path} ({baseline['meta'].get('commit')})")
+    for name, current in results['workloads'].items():
+        previous = baseline['workloads'].get(name)
+        if not previous:
+            continue
+        deltas = []
+        for key in ('p50', 'p95', 'p99'):
+            before, after = previous['latencyMs'][key], current['latencyMs'][key]
+            if before and after is not None:
+                deltas.append(f'{key} {(after - before) / before * 100:+.1f}%')
+        before, after = previous['throughputRps'], current['throughputRps']
+        if before and after is not None:
+            deltas.append(f'rps {(after - before) / before * 100:+.1f}%')
+        deltas.append(f"non2xx {previous.get('non2xx', 0)} -> {current['non2xx']}")
+        deltas.append(f"rejected {previous.get('rejected', 0)} -> {current['rejected']}")
+        print(f"  {name:<16} {'  '.join(deltas)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='TL Building API benchmark suite')
+    parser.add_argument('--size', type=int, default=10000, help='synthetic catalog size (10k to 1M)')
+    parser.add_argument('--users', type=int, default=1000, help='synthetic users added for auth workloads')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--workload', action='append', choices=sorted(WORKLOADS),
+                        help='workload to run (repeatable, default: all)')
+    parser.add_argument('--operations', type=int, default=2000, help='operations per workload')
+    parser.add_argument('--warmup', type=int, default=100, help='untimed operations per workload')
+    parser.add_argument('--target', choices=['inprocess', 'http'], default='inprocess')
+    parser.add_argument('--url', help='existing server to benchmark (http target only); '
+                                      'without it a seeded local server is started')
+    parser.add_argument('--concurrency', type=int, default=1, help='client threads (http target)')
+    parser.add_argument('--output', help='results file (default: benchmarks/results/<timestamp>.json)')
+    parser.add_argument('--baseline', help='previous results file to compare against')
+    parser.add_argument('--force-compare', action='store_true',
+                        help='compare with --baseline even if run parameters differ')
+    args = parser.parse_args()
+
+    if args.target == 'inprocess' and args.concurrency != 1:
+        parser.error('--concurrency is only supported with --target http')
+    if args.url and args.target != 'http':
+        parser.error('--url requires --target http')
+    if args.url and urlsplit(args.url).scheme not in ('http', 'https'):
+        parser.error('--url must be an http:// or https:// URL')
+
+    workloads = args.workload or list(WORKLOADS)
+    server = None
+
+    if args.url:
+        ctx = remote_context(HttpClient(args.url), None)
+        base_url = args.url
+    else:
+        started = time.perf_counter()
+        app, ctx = seed_app(args.size, args.users, args.seed)
+        print(f'Seeded {args.size} properties and {args.users} users in {time.perf_counter() - started:.1f}s')
+        if args.target == 'http':
+            server, base_url = start_local_server(app)
+
+    def make_client(recorder):
+        if args.target == 'http':
+            return HttpClient(base_url, recorder)
+        return InProcessClient(app, recorder)
+
+    results = {
+        'meta': {
+            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'target': args.target,
+            'url': args.url,
+            'catalogSize': ctx['catalog_size'],
+            'users': None if args.url else args.users,
+            'seed': args.seed,
+            'operations': args.operations,
+            'warmup': args.warmup,
+            'concurrency': args.concurrency
+        },
+        'workloads': {}
+    }
+
+    try:
+        for name in workloads:
+            result = run_workload(name, make_client, ctx, args.operations, args.warmup, args.concurrency, args.seed)
+            results['workloads'][name] = result
+            latency = result['latencyMs']
+            print(f"{name:<16} {result['requests']:>7} req  {result['throughputRps']:>9} req/s  "
+                  f"p50 {latency['p50']}ms  p95 {latency['p95']}ms  p99 {latency['p99']}ms  "
+                  f"errors {result['errors']}  non2xx {result['non2xx']}  rejected {result['rejected']}")
+            if result['rejected']:
+                print(f"  warning: {result['rejected']} requests were rejected by admission control "
+                      f"(429/503) and excluded from latency; the target is rate limiting or shedding load",
+                      file=sys.stderr)
+            if result['non2xx']:
+                failing = {k: v['non2xx'] for k, v in result['byRequest'].items() if v['non2xx']}
+                print(f'  warning: non-2xx responses are included in the latency figures: {failing}',
+                      file=sys.stderr)
+    finally:
+        if server is not None:
+            server.shutdown()
+
+    output = args.output or os.path.join(RESULTS_DIR, datetime.utcnow().strftime('%Y%m%dT%H%M%SZ') + '.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    print(f'Results written to {output}')
+
+    if args.baseline:
+        compare(results, args.baseline, force=args.force_compare)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+from catalog import CITIES, TYPES, STATUSES
+
+LIMITS = [10, 20, 50]
+FILTER_CITIES = [c[0] for c in CITIES] + ['paulo', 'rio']
+FILTER_TYPES = [t[0] for t in TYPES]
+
+
+def _random_filters(rng):
+    params = {}
+    if rng.random() < 0.5:
+        params['city'] = rng.choice(FILTER_CITIES)
+    if rng.random() < 0.4:
+        params['type'] = rng.choice(FILTER_TYPES).lower()
+    if rng.random() < 0.4:
+        params['status'] = rng.choice(STATUSES).lower()
+    if rng.random() < 0.3:
+        low = rng.choice([500, 1000, 1500, 2000, 3000])
+        params['minRent'] = low
+        if rng.random() < 0.6:
+            params['maxRent'] = low + rng.choice([1000, 2000, 5000])
+    params['limit'] = rng.choice(LIMITS)
+    params['page'] = 1 if rng.random() < 0.7 else rng.randint(2, 5)
+    return params
+
+
+def mixed_filters(client, rng, ctx):
+    client.get('list_filtered', '/api/properties', params=_random_filters(rng))
+
+
+def deep_pagination(client, rng, ctx):
+    limit = rng.choice(LIMITS)
+    last_page = max(1, (ctx['catalog_size'] + limit - 1) // limit)
+    # Bias towards the tail where slicing offsets are largest
+    page = max(1, last_page - int(rng.expovariate(1 / 20)))
+    client.get('list_deep_page', '/api/properties', params={'page': page, 'limit': limit})
+
+
+def detail_reads(client, rng, ctx):
+    property_id = rng.randint(1, ctx['catalog_size'])
+    client.get('property_detail', f'/api/properties/{property_id}')
+
+
+def crud_churn(client, rng, ctx):
+    headers = {'Authorization': f"Bearer {ctx['owner_token']}"}
+    city, state = rng.choice([(c[0], c[1]) for c in CITIES])
+    status, body = client.post('property_create', '/api/properties', headers=headers, json={
+        'title': f'Benchmark {rng.randint(0, 10 ** 6)}',
+        'description': 'Imóvel criado pelo benchmark',
+        'type': rng.choice(FILTER_TYPES),
+        'address': f'Rua Benchmark, {rng.randint(1, 999)}',
+        'city': city,
+        'state': state,
+        'monthlyRent': rng.randint(800, 9000),
+        'bedrooms': rng.randint(0, 4)
+    })
+    if status != 201 or not body:
+        return
+
+    property_id = body['data']['id']
+    client.put('property_update', f'/api/properties/{property_id}', headers=headers, json={
+        'monthlyRent': rng.randint(800, 9000),
+        'status': rng.choice(STATUSES)
+    })
+    client.delete('property_delete', f'/api/properties/{property_id}', headers=headers)
+
+
+def auth_burst(client, rng, ctx):
+    email = rng.choice(ctx['user_emails'])
+    status, body = client.post('auth_login', '/api/auth/login', json={'email': email, 'password': '123456'})
+    if status != 200 or not body:
+        return
+
+    headers = {'Authorization': f"Bearer {body['data']['accessToken']}"}
+    for _ in range(rng.randint(1, 3)):
+        client.get('auth_profile', '/api/auth/profile', headers=headers)
+
+
+WORKLOADS = {
+    'mixed_filters': mixed_filters,
+    'deep_pagination': deep_pagination,
+    'detail_reads': detail_reads,
+    'crud_churn': crud_churn,
+    'auth_burst': auth_burst,
+}
@@ -10,6 +10,9 @@ from src.models.user import db
 from src.routes.user import user_bp
 from src.routes.auth import auth_bp
 from src.routes.properties import properties_bp
+from src.routes.metrics import init_metrics
+from src.routes.admission import init_admission
+from src.routes.profiling import init_profiling
 
 app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'tl-building-secret-key-2025')
@@ -28,6 +31,16 @@ app.register_blueprint(user_bp, url_prefix='/api')
 app.register_blueprint(auth_bp, url_prefix='/api')
 app.register_blueprint(properties_bp, url_prefix='/api')
 
+# Request instrumentation and Prometheus /metrics endpoint
+init_metrics(app)
+
+# Admission control: per-route-class concurrency caps, bounded queues and auth rate limits.
+# Registered after metrics so shed requests and queue waits are still measured.
+init_admission(app)
+
+# Opt-in request profiling (X-Profile header with PROFILE_ADMIN_TOKEN, or PROFILE_SAMPLE_RATE)
+init_profiling(app)
+
 # Database configuration
 app.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(os.path.dirname(__file__), 'database', 'app.db')}"
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
@@ -55,6 +68,7 @@ def api_docs():
         'version': '1.0.0',
         'documentation': '/api',
         'health': '/health',
+        'metrics': '/metrics',
         'endpoints': {
             'auth': {
                 'login': 'POST /api/auth/login',
@@ -69,6 +83,10 @@ def api_docs():
                 'update': 'PUT /api/properties/{id}',
                 'delete': 'DELETE /api/properties/{id}'
             },
+            'admin': {
+                'profiles': 'GET /api/admin/profiles',
+                'profile': 'GET /api/admin/profiles/{id}'
+            },
             'users': {
                 'list': 'GET /api/users',
                 'get': 'GET /api/users/{id}',
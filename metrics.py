@@ -0,0 +1,230 @@
+from flask import Blueprint, Response, request, g
+from bisect import bisect_left
+import threading
+import time
+
+metrics_bp = Blueprint('metrics', __name__)
+
+# Default buckets (seconds) for request latency
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Default buckets (bytes) for response sizes
+SIZE_BUCKETS = (128, 512, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+# Default buckets (items) for filter result sizes
+COUNT_BUCKETS = (0, 1, 5, 10, 50, 100, 500, 1000, 5000, 10000, 100000, 1000000)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=None):
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    kind = 'untyped'
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def _key(self, labels):
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f'{self.name} expects labels {self.labelnames}')
+        return tuple(str(v) for v in labels)
+
+    def collect(self):
+        lines = [
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} {self.kind}'
+        ]
+        with self._lock:
+            items = sorted(self._values.items())
+            lines.extend(self._render(key, value) for key, value in items)
+        return '\n'.join(lines)
+
+    def _render(self, key, value):
+        return f'{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}'
+
+
+class Counter(_Metric):
+    kind = 'counter'
+
+    def inc(self, *labels, amount=1):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+
+class Gauge(_Metric):
+    kind = 'gauge'
+
+    def inc(self, *labels, amount=1):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, *labels, amount=1):
+        self.inc(*labels, amount=-amount)
+
+    def set(self, value, *labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, *labels):
+        key = self._key(labels)
+        # Store per-bucket (non-cumulative) counts; cumulate only on scrape
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def _render(self, key, state):
+        counts, total, count = state
+        lines = []
+        cumulative = 0
+        for bound, bucket_count in zip(self.buckets + (float('inf'),), counts):
+            cumulative += bucket_count
+            labels = _format_labels(self.labelnames, key, f'le="{_format_value(float(bound))}"')
+            lines.append(f'{self.name}_bucket{labels} {cumulative}')
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f'{self.name}_sum{labels} {_format_value(total)}')
+        lines.append(f'{self.name}_count{labels} {count}')
+        return '\n'.join(lines)
+
+
+class Registry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics = {}
+
+    def register(self, metric):
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f'Metric {metric.name} already registered')
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name, documentation, labelnames=()):
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def expose(self):
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return '\n'.join(m.collect() for m in metrics) + '\n'
+
+
+registry = Registry()
+
+# HTTP instrumentation
+REQUEST_LATENCY = registry.histogram(
+    'tl_http_request_duration_seconds',
+    'HTTP request latency in seconds',
+    ('method', 'endpoint', 'status')
+)
+REQUESTS_IN_FLIGHT = registry.gauge(
+    'tl_http_requests_in_flight',
+    'HTTP requests currently being processed',
+    ('method', 'endpoint')
+)
+RESPONSE_SIZE = registry.histogram(
+    'tl_http_response_size_bytes',
+    'HTTP response body size in bytes',
+    ('method', 'endpoint', 'status'),
+    buckets=SIZE_BUCKETS
+)
+
+# Internal counters
+FILTER_RESULT_SIZE = registry.histogram(
+    'tl_properties_filter_result_size',
+    'Number of properties matching a listing query before pagination',
+    (),
+    buckets=COUNT_BUCKETS
+)
+TOKEN_DECODES = registry.counter(
+    'tl_token_decodes_total',
+    'JWT decode attempts by result',
+    ('source', 'result')
+)
+ADMISSION_REJECTIONS = registry.counter(
+    'tl_admission_rejections_total',
+    'Requests shed by admission control or rate limiting',
+    ('route_class', 'reason')
+)
+
+
+def _endpoint_label():
+    # Use the matched route rule so path parameters don't blow up cardinality
+    if request.url_rule is not None:
+        return request.url_rule.rule
+    return 'unmatched'
+
+
+def _before_request():
+    g._metrics_start = time.perf_counter()
+    g._metrics_endpoint = _endpoint_label()
+    REQUESTS_IN_FLIGHT.inc(request.method, g._metrics_endpoint)
+
+
+def _after_request(response):
+    start = g.pop('_metrics_start', None)
+    if start is None:
+        return response
+    endpoint = g._metrics_endpoint
+    status = str(response.status_code)
+    REQUEST_LATENCY.observe(time.perf_counter() - start, request.method, endpoint, status)
+    size = response.content_length
+    if size is not None:
+        RESPONSE_SIZE.observe(size, request.method, endpoint, status)
+    return response
+
+
+def _teardown_request(exc):
+    endpoint = g.pop('_metrics_endpoint', None)
+    if endpoint is not None:
+        REQUESTS_IN_FLIGHT.dec(request.method, endpoint)
+
+
+def init_metrics(app):
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.teardown_request(_teardown_request)
+    app.register_blueprint(metrics_bp)
+
+
+@metrics_bp.route('/metrics', methods=['GET'])
+def expose_metrics():
+    return Response(registry.expose(), content_type='text/plain; version=0.0.4; charset=utf-8')
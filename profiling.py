@@ -0,0 +1,256 @@
+from flask import Blueprint, request, jsonify, g
+from contextlib import contextmanager
+from datetime import datetime
+import cProfile
+import hmac
+import pstats
+import random
+import io
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+import jwt
+
+profiling_bp = Blueprint('profiling', __name__)
+
+# Fraction of requests profiled without the admin header (0 disables sampling)
+PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE', 0))
+# Requests slower than this are persisted to the ring buffer (phase timings, plus cProfile
+# output when the request was sampled)
+PROFILE_SLOW_MS = float(os.environ.get('PROFILE_SLOW_MS', 500))
+# Maximum number of profiles kept on disk
+PROFILE_MAX_ENTRIES = int(os.environ.get('PROFILE_MAX_ENTRIES', 50))
+# Stored next to app.db in the application's database directory
+PROFILE_DIR = os.environ.get(
+    'PROFILE_DIR',
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'database', 'profiles')
+)
+# Operator secret for on-demand profiling and the admin endpoints, sent as X-Profile-Token.
+# Tokens for users with the ADMIN role are accepted as well.
+PROFILE_ADMIN_TOKEN = os.environ.get('PROFILE_ADMIN_TOKEN', '')
+PROFILE_HEADER = 'X-Profile'
+PROFILE_TOKEN_HEADER = 'X-Profile-Token'
+
+_ring_lock = threading.Lock()
+# Only one cProfile runs at a time. From Python 3.12 cProfile hooks every thread, so a
+# second profiler cannot start and the running one also records concurrent requests.
+_profiler_lock = threading.Lock()
+PROFILER_SCOPE = 'all-threads' if sys.version_info >= (3, 12) else 'request-thread'
+
+
+def _is_admin():
+    presented = request.headers.get(PROFILE_TOKEN_HEADER)
+    if PROFILE_ADMIN_TOKEN and presented:
+        return hmac.compare_digest(presented.encode(), PROFILE_ADMIN_TOKEN.encode())
+
+    auth_header = request.headers.get('Authorization')
+
+    if not auth_header or not auth_header.startswith('Bearer '):
+        return False
+
+    # Imported here because auth imports phase() from this module
+    from src.routes.auth import decode_token
+
+    try:
+        payload = decode_token(auth_header.split(' ')[1], 'profiling')
+    except jwt.InvalidTokenError:
+        return False
+
+    return payload.get('role') == 'ADMIN'
+
+
+def _profile_mode():
+    # 'requested' profiles are always kept; 'sampled' ones only when slow. Requests that are
+    # neither still get phase timings and are kept when slow.
+    if request.headers.get(PROFILE_HEADER):
+        return 'requested' if _is_admin() else None
+    if PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE:
+        return 'sampled'
+    return None
+
+
+@contextmanager
+def phase(name):
+    # Records wall time of a request phase; no-op outside the profiling hooks
+    phases = g.get('_profile_phases')
+    if phases is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        phases[name] = phases.get(name, 0.0) + (time.perf_counter() - start) * 1000
+
+
+def _before_request():
+    g._profile_start = time.perf_counter()
+    g._profile_phases = {}
+    mode = _profile_mode()
+    g._profile_mode = mode
+    if mode is not None:
+        g._profiler = _start_profiler()
+
+
+def _start_profiler():
+    if not _profiler_lock.acquire(blocking=False):
+        # Another request is being profiled; keep phase timings only
+        return None
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Some other profiling tool is active
+        _profiler_lock.release()
+        return None
+    return profiler
+
+
+def _stop_profiler():
+    profiler = g.pop('_profiler', None)
+    if profiler is not None:
+        profiler.disable()
+        _profiler_lock.release()
+    return profiler
+
+
+def _after_request(response):
+    start = g.pop('_profile_start', None)
+    if start is None:
+        return response
+
+    profiler = _stop_profiler()
+    duration_ms = (time.perf_counter() - start) * 1000
+    phases = {name: round(ms, 3) for name, ms in g.pop('_profile_phases', {}).items()}
+    mode = g.pop('_profile_mode', None)
+
+    if mode is not None:
+        response.headers['X-Profile-Duration-Ms'] = f'{duration_ms:.3f}'
+
+    if mode == 'requested' or duration_ms >= PROFILE_SLOW_MS:
+        entry = {
+            'id': uuid.uuid4().hex[:12],
+            'mode': mode or 'slow',
+            'method': request.method,
+            'path': request.full_path.rstrip('?'),
+            'endpoint': request.url_rule.rule if request.url_rule is not None else None,
+            'status': response.status_code,
+            'durationMs': round(duration_ms, 3),
+            'phases': phases,
+            'profile': _format_stats(profiler),
+            # cProfile output may include other threads' work on Python 3.12+
+            'profilerScope': PROFILER_SCOPE if profiler is not None else None,
+            'createdAt': datetime.utcnow().isoformat() + 'Z'
+        }
+        _store_profile(entry)
+        response.headers['X-Profile-Id'] = entry['id']
+
+    return response
+
+
+def _teardown_request(exc):
+    # Never leave the profiler running if after_request was skipped
+    _stop_profiler()
+
+
+def _format_stats(profiler, limit=40):
+    if profiler is None:
+        return None
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats('cumulative').print_stats(limit)
+    return stream.getvalue()
+
+
+def _profile_files():
+    if not os.path.isdir(PROFILE_DIR):
+        return []
+    # File names start with a nanosecond timestamp, so lexical order is age order
+    return sorted(f for f in os.listdir(PROFILE_DIR) if f.endswith('.json'))
+
+
+def _store_profile(entry):
+    with _ring_lock:
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        filename = f"{time.time_ns():020d}-{entry['id']}.json"
+        with open(os.path.join(PROFILE_DIR, filename), 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+
+        files = _profile_files()
+        for old in files[:max(len(files) - PROFILE_MAX_ENTRIES, 0)]:
+            try:
+                os.remove(os.path.join(PROFILE_DIR, old))
+            except OSError:
+                pass
+
+
+def _load_profile(filename):
+    try:
+        with open(os.path.join(PROFILE_DIR, filename), encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def init_profiling(app):
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.teardown_request(_teardown_request)
+    app.register_blueprint(profiling_bp, url_prefix='/api')
+
+
+@profiling_bp.route('/admin/profiles', methods=['GET'])
+def list_profiles():
+    if not _is_admin():
+        return jsonify({
+            'success': False,
+            'message': 'Acesso restrito a administradores',
+            'code': 'PERMISSION_DENIED'
+        }), 403
+
+    profiles = []
+    for filename in reversed(_profile_files()):
+        entry = _load_profile(filename)
+        if entry:
+            entry.pop('profile', None)
+            profiles.append(entry)
+
+    return jsonify({
+        'success': True,
+        'message': 'Perfis obtidos com sucesso',
+        'data': {
+            'profiles': profiles,
+            'slowThresholdMs': PROFILE_SLOW_MS,
+            'sampleRate': PROFILE_SAMPLE_RATE,
+            'maxEntries': PROFILE_MAX_ENTRIES
+        }
+    })
+
+
+@profiling_bp.route('/admin/profiles/<profile_id>', methods=['GET'])
+def get_profile_entry(profile_id):
+    if not _is_admin():
+        return jsonify({
+            'success': False,
+            'message': 'Acesso restrito a administradores',
+            'code': 'PERMISSION_DENIED'
+        }), 403
+
+    filename = next((f for f in _profile_files() if f.endswith(f'-{profile_id}.json')), None)
+    entry = _load_profile(filename) if filename else None
+
+    if not entry:
+        return jsonify({
+            'success': False,
+            'message': 'Perfil não encontrado',
+            'code': 'PROFILE_NOT_FOUND'
+        }), 404
+
+    return jsonify({
+        'success': True,
+        'message': 'Perfil obtido com sucesso',
+        'data': entry
+    })
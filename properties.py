@@ -1,12 +1,12 @@
 from flask import Blueprint, request, jsonify
 from datetime import datetime
 import jwt
-import os
+from src.routes.metrics import FILTER_RESULT_SIZE
+from src.routes.auth import decode_token
+from src.routes.profiling import phase
 
 properties_bp = Blueprint('properties', __name__)
 
-SECRET_KEY = os.environ.get('SECRET_KEY', 'tl-building-secret-key-2025')
-
 # Mock properties database
 properties_db = [
     {
@@ -98,9 +98,8 @@ def verify_token():
     token = auth_header.split(' ')[1]
     
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=['HS256'])
-        return payload
-    except:
+        return decode_token(token, 'properties')
+    except jwt.InvalidTokenError:
         return None
 
 @properties_bp.route('/properties', methods=['GET'])
@@ -116,42 +115,46 @@ def get_properties():
         max_rent = request.args.get('maxRent')
         
         # Filter properties
-        filtered_properties = properties_db.copy()
-        
-        if status:
-            filtered_properties = [p for p in filtered_properties if p['status'] == status.upper()]
-        
-        if property_type:
-            filtered_properties = [p for p in filtered_properties if p['type'] == property_type.upper()]
-        
-        if city:
-            filtered_properties = [p for p in filtered_properties if city.lower() in p['city'].lower()]
-        
-        if min_rent:
-            filtered_properties = [p for p in filtered_properties if p['monthlyRent'] >= float(min_rent)]
-        
-        if max_rent:
-            filtered_properties = [p for p in filtered_properties if p['monthlyRent'] <= float(max_rent)]
+        with phase('filter'):
+            filtered_properties = properties_db.copy()
+            
+            if status:
+                filtered_properties = [p for p in filtered_properties if p['status'] == status.upper()]
+            
+            if property_type:
+                filtered_properties = [p for p in filtered_properties if p['type'] == property_type.upper()]
+            
+            if city:
+                filtered_properties = [p for p in filtered_properties if city.lower() in p['city'].lower()]
+            
+            if min_rent:
+                filtered_properties = [p for p in filtered_properties if p['monthlyRent'] >= float(min_rent)]
+            
+            if max_rent:
+                filtered_properties = [p for p in filtered_properties if p['monthlyRent'] <= float(max_rent)]
         
         # Pagination
-        total = len(filtered_properties)
-        start = (page - 1) * limit
-        end = start + limit
-        paginated_properties = filtered_properties[start:end]
-        
-        return jsonify({
-            'success': True,
-            'message': 'Imóveis obtidos com sucesso',
-            'data': {
-                'properties': paginated_properties,
-                'pagination': {
-                    'page': page,
-                    'limit': limit,
-                    'total': total,
-                    'totalPages': (total + limit - 1) // limit
+        with phase('paginate'):
+            total = len(filtered_properties)
+            FILTER_RESULT_SIZE.observe(total)
+            start = (page - 1) * limit
+            end = start + limit
+            paginated_properties = filtered_properties[start:end]
+        
+        with phase('serialize'):
+            return jsonify({
+                'success': True,
+                'message': 'Imóveis obtidos com sucesso',
+                'data': {
+                    'properties': paginated_properties,
+                    'pagination': {
+                        'page': page,
+                        'limit': limit,
+                        'total': total,
+                        'totalPages': (total + limit - 1) // limit
+                    }
                 }
-            }
-        })
+            })
         
     except Exception as e:
         return jsonify({
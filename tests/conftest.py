@@ -0,0 +1,18 @@
+import importlib.util
+import os
+import sys
+import types
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Same import root as main.py, so tests can import the src package
+sys.path.insert(0, ROOT)
+
+# The backend modules live flat at the repository root here, while the app imports them as
+# src.* / src.routes.* (its deployed layout). Without a src package on disk, expose the root
+# under both names so `from src.routes.metrics import ...` resolves to ./metrics.py.
+if importlib.util.find_spec('src') is None:
+    for name in ('src', 'src.routes'):
+        package = types.ModuleType(name)
+        package.__path__ = [ROOT]
+        sys.modules[name] = package
+    sys.modules['src'].routes = sys.modules['src.routes']
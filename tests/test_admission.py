@@ -0,0 +1,175 @@
+import threading
+import time
+
+import pytest
+from flask import Flask, jsonify
+
+from src.routes import admission
+from src.routes.admission import AdmissionGate, TokenBucketLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(admission.time, 'monotonic', fake)
+    return fake
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setattr(admission, 'ADMISSION_ENABLED', True)
+    monkeypatch.setattr(admission, 'TRUSTED_PROXY_HOPS', 0)
+    monkeypatch.setattr(admission, 'gates', {
+        name: AdmissionGate(name, 4, 4, 1.0) for name in admission.ROUTE_CLASS_DEFAULTS
+    })
+    monkeypatch.setattr(admission, 'auth_limiter', TokenBucketLimiter(1.0, 100, 100))
+
+    app = Flask(__name__)
+
+    @app.route('/api/properties/<property_id>')
+    def get_property(property_id):
+        return jsonify({'success': True})
+
+    @app.route('/api/auth/login', methods=['POST'])
+    def login():
+        return jsonify({'success': True})
+
+    admission.init_admission(app)
+    return app
+
+
+def test_gate_sheds_when_queue_is_full():
+    gate = AdmissionGate('test', 1, 0, 1.0)
+
+    assert gate.acquire()
+    started = time.monotonic()
+    assert not gate.acquire()
+    assert time.monotonic() - started < 0.5
+
+    gate.release()
+    assert gate.acquire()
+
+
+def test_gate_sheds_when_deadline_passes():
+    gate = AdmissionGate('test', 1, 1, 0.05)
+    assert gate.acquire()
+
+    started = time.monotonic()
+    assert not gate.acquire()
+    assert time.monotonic() - started >= 0.05
+    assert gate.waiting == 0
+    assert gate.active == 1
+
+
+def test_gate_admits_queued_request_on_release():
+    gate = AdmissionGate('test', 1, 1, 5.0)
+    assert gate.acquire()
+
+    admitted = []
+    waiter = threading.Thread(target=lambda: admitted.append(gate.acquire()))
+    waiter.start()
+    deadline = time.monotonic() + 5
+    while gate.waiting == 0:
+        if time.monotonic() > deadline:
+            gate.release()
+            waiter.join(timeout=5)
+            pytest.fail('acquire() did not queue behind the saturated gate')
+        time.sleep(0.001)
+
+    gate.release()
+    waiter.join(timeout=5)
+
+    assert admitted == [True]
+    assert gate.active == 1
+
+
+def test_saturated_route_class_returns_503_when_queue_full(app):
+    gate = admission.gates['read'] = AdmissionGate('read', 1, 0, 1.0)
+    assert gate.acquire()
+
+    response = app.test_client().get('/api/properties/1')
+
+    assert response.status_code == 503
+    assert response.headers['Retry-After'] == '1'
+    assert response.get_json()['code'] == 'SERVER_BUSY'
+
+
+def test_saturated_route_class_returns_503_after_deadline(app):
+    gate = admission.gates['read'] = AdmissionGate('read', 1, 1, 0.05)
+    assert gate.acquire()
+
+    response = app.test_client().get('/api/properties/1')
+
+    assert response.status_code == 503
+    assert gate.waiting == 0
+
+    gate.release()
+    assert app.test_client().get('/api/properties/1').status_code == 200
+    assert gate.active == 0
+
+
+def test_token_bucket_refills_over_time(clock):
+    limiter = TokenBucketLimiter(1.0, 2, 10)
+
+    assert limiter.consume('client') == 0
+    assert limiter.consume('client') == 0
+    assert limiter.consume('client') == pytest.approx(1.0)
+
+    clock.now += 0.5
+    assert limiter.consume('client') == pytest.approx(0.5)
+
+    clock.now += 0.5
+    assert limiter.consume('client') == 0
+
+
+def test_token_bucket_evicts_least_recently_used_client(clock):
+    limiter = TokenBucketLimiter(1.0, 1, 2)
+
+    assert limiter.consume('a') == 0
+    assert limiter.consume('b') == 0
+    assert limiter.consume('a') > 0
+    assert limiter.consume('c') == 0
+
+    assert list(limiter._buckets) == ['a', 'c']
+    # The evicted client starts again from a full bucket
+    assert limiter.consume('b') == 0
+    assert list(limiter._buckets) == ['c', 'b']
+
+
+def test_login_is_rate_limited_per_client(app, monkeypatch):
+    monkeypatch.setattr(admission, 'auth_limiter', TokenBucketLimiter(1 / 60, 1, 100))
+    client = app.test_client()
+
+    assert client.post('/api/auth/login', environ_base={'REMOTE_ADDR': '10.0.0.1'}).status_code == 200
+    response = client.post('/api/auth/login', environ_base={'REMOTE_ADDR': '10.0.0.1'})
+    assert response.status_code == 429
+    assert int(response.headers['Retry-After']) >= 1
+    assert client.post('/api/auth/login', environ_base={'REMOTE_ADDR': '10.0.0.2'}).status_code == 200
+
+
+def test_trusted_proxy_hops_keys_clients_by_forwarded_address(monkeypatch):
+    monkeypatch.setattr(admission, 'ADMISSION_ENABLED', True)
+    monkeypatch.setattr(admission, 'TRUSTED_PROXY_HOPS', 1)
+    monkeypatch.setattr(admission, 'auth_limiter', TokenBucketLimiter(1 / 60, 1, 100))
+
+    app = Flask(__name__)
+
+    @app.route('/api/auth/login', methods=['POST'])
+    def login():
+        return jsonify({'success': True})
+
+    admission.init_admission(app)
+    client = app.test_client()
+    proxy = {'REMOTE_ADDR': '127.0.0.1'}
+
+    assert client.post('/api/auth/login', environ_base=proxy, headers={'X-Forwarded-For': '203.0.113.1'}).status_code == 200
+    assert client.post('/api/auth/login', environ_base=proxy, headers={'X-Forwarded-For': '203.0.113.2'}).status_code == 200
+    assert client.post('/api/auth/login', environ_base=proxy, headers={'X-Forwarded-For': '203.0.113.1'}).status_code == 429
@@ -0,0 +1,106 @@
+import pytest
+from flask import Flask, jsonify
+
+from src.routes import admission, metrics
+from src.routes.metrics import Counter, Histogram, Registry
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram('test_latency_seconds', 'Test latency', ('endpoint',), buckets=(0.1, 0.5, 1.0))
+    for value in (0.05, 0.1, 0.3, 0.7, 2.0):
+        histogram.observe(value, '/api/properties')
+
+    lines = histogram.collect().splitlines()
+
+    assert lines[0] == '# HELP test_latency_seconds Test latency'
+    assert lines[1] == '# TYPE test_latency_seconds histogram'
+    assert lines[2:] == [
+        'test_latency_seconds_bucket{endpoint="/api/properties",le="0.1"} 2',
+        'test_latency_seconds_bucket{endpoint="/api/properties",le="0.5"} 3',
+        'test_latency_seconds_bucket{endpoint="/api/properties",le="1"} 4',
+        'test_latency_seconds_bucket{endpoint="/api/properties",le="+Inf"} 5',
+        'test_latency_seconds_sum{endpoint="/api/properties"} 3.15',
+        'test_latency_seconds_count{endpoint="/api/properties"} 5',
+    ]
+
+
+def test_histogram_without_labels():
+    histogram = Histogram('test_sizes', 'Test sizes', buckets=(10,))
+    histogram.observe(3)
+
+    assert histogram.collect().splitlines()[2:] == [
+        'test_sizes_bucket{le="10"} 1',
+        'test_sizes_bucket{le="+Inf"} 1',
+        'test_sizes_sum 3',
+        'test_sizes_count 1',
+    ]
+
+
+def test_registry_exposes_metrics_and_escapes_labels():
+    registry = Registry()
+    counter = registry.register(Counter('test_total', 'Test counter', ('path',)))
+    counter.inc('a"b\\c')
+    counter.inc('a"b\\c', amount=2)
+
+    assert 'test_total{path="a\\"b\\\\c"} 3\n' in registry.expose()
+
+
+@pytest.fixture
+def app():
+    app = Flask(__name__)
+
+    @app.route('/api/properties/<property_id>')
+    def get_property(property_id):
+        assert metrics.REQUESTS_IN_FLIGHT._values[('GET', '/api/properties/<property_id>')] >= 1
+        return jsonify({'success': True, 'id': property_id})
+
+    metrics.init_metrics(app)
+    return app
+
+
+def _latency_count(method, endpoint, status):
+    state = metrics.REQUEST_LATENCY._values.get((method, endpoint, status))
+    return state[2] if state else 0
+
+
+def test_request_hooks_label_by_route_rule_and_reset_in_flight(app):
+    endpoint = '/api/properties/<property_id>'
+    before = _latency_count('GET', endpoint, '200')
+
+    response = app.test_client().get('/api/properties/42')
+
+    assert response.status_code == 200
+    assert _latency_count('GET', endpoint, '200') == before + 1
+    assert ('GET', endpoint, '200') in metrics.RESPONSE_SIZE._values
+    assert metrics.REQUESTS_IN_FLIGHT._values[('GET', endpoint)] == 0
+    assert not any('/api/properties/42' in key for key in metrics.REQUEST_LATENCY._values)
+
+
+def test_metrics_endpoint_uses_prometheus_content_type(app):
+    app.test_client().get('/api/properties/1')
+
+    response = app.test_client().get('/metrics')
+
+    assert response.status_code == 200
+    assert response.content_type == 'text/plain; version=0.0.4; charset=utf-8'
+    assert '# TYPE tl_http_request_duration_seconds histogram' in response.text
+    assert 'tl_http_request_duration_seconds_count{method="GET",endpoint="/api/properties/<property_id>",status="200"}' \
+        in response.text
+
+
+def test_request_shed_by_admission_is_counted_as_503(app, monkeypatch):
+    monkeypatch.setattr(admission, 'ADMISSION_ENABLED', True)
+    monkeypatch.setattr(admission, 'TRUSTED_PROXY_HOPS', 0)
+    gate = admission.AdmissionGate('read', 1, 0, 1.0)
+    monkeypatch.setitem(admission.gates, 'read', gate)
+    admission.init_admission(app)
+    assert gate.acquire()
+
+    endpoint = '/api/properties/<property_id>'
+    before = _latency_count('GET', endpoint, '503')
+
+    response = app.test_client().get('/api/properties/1')
+
+    assert response.status_code == 503
+    assert _latency_count('GET', endpoint, '503') == before + 1
+    assert metrics.REQUESTS_IN_FLIGHT._values[('GET', endpoint)] == 0
@@ -0,0 +1,169 @@
+import os
+from datetime import datetime, timedelta
+
+import jwt
+import pytest
+from flask import Flask, jsonify, g
+
+from src.routes import profiling
+from src.routes.auth import SECRET_KEY
+from src.routes.profiling import phase
+
+ADMIN_TOKEN = 'operator-secret'
+
+
+@pytest.fixture
+def app(monkeypatch, tmp_path):
+    monkeypatch.setattr(profiling, 'PROFILE_DIR', str(tmp_path))
+    monkeypatch.setattr(profiling, 'PROFILE_ADMIN_TOKEN', ADMIN_TOKEN)
+    monkeypatch.setattr(profiling, 'PROFILE_SAMPLE_RATE', 0)
+    monkeypatch.setattr(profiling, 'PROFILE_SLOW_MS', 60000)
+    monkeypatch.setattr(profiling, 'PROFILE_MAX_ENTRIES', 50)
+
+    app = Flask(__name__)
+
+    @app.route('/api/properties')
+    def get_properties():
+        with phase('filter'):
+            pass
+        with phase('serialize'):
+            return jsonify({'success': True})
+
+    profiling.init_profiling(app)
+    return app
+
+
+def _jwt(role):
+    payload = {'userId': '1', 'email': 'ops@tlbuilding.com', 'role': role, 'exp': datetime.utcnow() + timedelta(hours=1)}
+    return jwt.encode(payload, SECRET_KEY, algorithm='HS256')
+
+
+def _stored(tmp_path):
+    return sorted(f for f in os.listdir(tmp_path) if f.endswith('.json'))
+
+
+def test_requested_profile_with_admin_token_is_always_stored(app, tmp_path):
+    client = app.test_client()
+
+    response = client.get('/api/properties', headers={'X-Profile': '1', 'X-Profile-Token': ADMIN_TOKEN})
+
+    profile_id = response.headers['X-Profile-Id']
+    entry = client.get(f'/api/admin/profiles/{profile_id}', headers={'X-Profile-Token': ADMIN_TOKEN}).get_json()['data']
+    assert entry['mode'] == 'requested'
+    assert set(entry['phases']) == {'filter', 'serialize'}
+    assert entry['profile']
+    assert entry['profilerScope'] == profiling.PROFILER_SCOPE
+
+
+def test_requested_profile_with_admin_role_jwt(app, tmp_path):
+    response = app.test_client().get('/api/properties', headers={
+        'X-Profile': '1',
+        'Authorization': f"Bearer {_jwt('ADMIN')}"
+    })
+
+    assert 'X-Profile-Id' in response.headers
+    assert len(_stored(tmp_path)) == 1
+
+
+@pytest.mark.parametrize('headers', [
+    {'X-Profile-Token': 'wrong'},
+    {'Authorization': f"Bearer {_jwt('OWNER')}"},
+    {'Authorization': 'Bearer not-a-token'},
+    {},
+])
+def test_profile_header_ignored_without_admin_credentials(app, tmp_path, headers):
+    response = app.test_client().get('/api/properties', headers={'X-Profile': '1', **headers})
+
+    assert response.status_code == 200
+    assert 'X-Profile-Id' not in response.headers
+    assert _stored(tmp_path) == []
+
+
+def test_sampled_profile_is_dropped_when_fast(app, tmp_path, monkeypatch):
+    monkeypatch.setattr(profiling, 'PROFILE_SAMPLE_RATE', 1)
+
+    response = app.test_client().get('/api/properties')
+
+    assert 'X-Profile-Duration-Ms' in response.headers
+    assert 'X-Profile-Id' not in response.headers
+    assert _stored(tmp_path) == []
+
+
+def test_sampled_profile_is_stored_when_slow(app, tmp_path, monkeypatch):
+    monkeypatch.setattr(profiling, 'PROFILE_SAMPLE_RATE', 1)
+    monkeypatch.setattr(profiling, 'PROFILE_SLOW_MS', 0)
+
+    app.test_client().get('/api/properties')
+
+    entry = profiling._load_profile(_stored(tmp_path)[0])
+    assert entry['mode'] == 'sampled'
+    assert entry['profile']
+
+
+def test_slow_request_is_stored_without_sampling(app, tmp_path, monkeypatch):
+    monkeypatch.setattr(profiling, 'PROFILE_SLOW_MS', 0)
+
+    response = app.test_client().get('/api/properties')
+
+    assert 'X-Profile-Id' in response.headers
+    entry = profiling._load_profile(_stored(tmp_path)[0])
+    assert entry['mode'] == 'slow'
+    assert set(entry['phases']) == {'filter', 'serialize'}
+    assert entry['profile'] is None
+    assert entry['profilerScope'] is None
+
+
+def test_concurrent_profile_keeps_phase_timings_only(app, tmp_path):
+    assert profiling._profiler_lock.acquire(blocking=False)
+    try:
+        app.test_client().get('/api/properties', headers={'X-Profile': '1', 'X-Profile-Token': ADMIN_TOKEN})
+    finally:
+        profiling._profiler_lock.release()
+
+    entry = profiling._load_profile(_stored(tmp_path)[0])
+    assert entry['profile'] is None
+    assert entry['profilerScope'] is None
+    assert entry['phases']
+
+
+def test_ring_buffer_keeps_newest_entries(app, tmp_path, monkeypatch):
+    monkeypatch.setattr(profiling, 'PROFILE_MAX_ENTRIES', 3)
+    client = app.test_client()
+
+    ids = [
+        client.get('/api/properties', headers={'X-Profile': '1', 'X-Profile-Token': ADMIN_TOKEN}).headers['X-Profile-Id']
+        for _ in range(5)
+    ]
+
+    stored = _stored(tmp_path)
+    assert len(stored) == 3
+    assert [name.rsplit('-', 1)[1][:-len('.json')] for name in stored] == ids[2:]
+
+    listed = client.get('/api/admin/profiles', headers={'X-Profile-Token': ADMIN_TOKEN}).get_json()['data']['profiles']
+    assert [entry['id'] for entry in listed] == list(reversed(ids[2:]))
+    assert all('profile' not in entry for entry in listed)
+
+
+def test_admin_endpoints_require_credentials(app):
+    client = app.test_client()
+
+    assert client.get('/api/admin/profiles').status_code == 403
+    assert client.get('/api/admin/profiles', headers={'X-Profile-Token': 'wrong'}).status_code == 403
+    assert client.get('/api/admin/profiles/abc', headers={'Authorization': f"Bearer {_jwt('TENANT')}"}).status_code == 403
+    assert client.get('/api/admin/profiles', headers={'Authorization': f"Bearer {_jwt('ADMIN')}"}).status_code == 200
+
+
+def test_unknown_profile_returns_404(app):
+    response = app.test_client().get('/api/admin/profiles/missing', headers={'X-Profile-Token': ADMIN_TOKEN})
+
+    assert response.status_code == 404
+    assert response.get_json()['code'] == 'PROFILE_NOT_FOUND'
+
+
+def test_phase_is_noop_without_profiling_hooks():
+    app = Flask(__name__)
+
+    with app.test_request_context('/api/properties'):
+        with phase('filter'):
+            pass
+        assert g.get('_profile_phases') is None